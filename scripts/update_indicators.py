@@ -17,6 +17,7 @@ Added (v2):
 Notes:
 - FRED requires an API key. Set env var FRED_API_KEY (your GitHub Action already does).
 - Stooq is used for price series because it's simple and free.
+- Stdlib only. If `orjson` happens to be installed it is used for JSON parsing/encoding.
 - Composite dials are percentile-based and smoothed using yesterday's indicators.json
   (no database required).
 
@@ -28,15 +29,44 @@ NEW:
 from __future__ import annotations
 
 import bisect
-import csv
+import gzip
+import hashlib
+import http.client
 import json
+import operator
 import os
-from dataclasses import dataclass
+import threading
+import time
+import zlib
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, date, timedelta
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urljoin, urlsplit
 
-import urllib.request
+try:
+    import orjson  # optional: much faster JSON parsing; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
+json_loads: Callable[[bytes], object] = orjson.loads if orjson is not None else json.loads
+
+
+def json_dumps_pretty(obj: object) -> bytes:
+    """2-space indented UTF-8 JSON plus trailing newline; same bytes with or without orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def json_dumps_compact(obj: object, sort_keys: bool = False) -> bytes:
+    """Compact UTF-8 JSON (no whitespace), e.g. one NDJSON row."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys, ensure_ascii=False).encode("utf-8")
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -48,32 +78,273 @@ HISTORY_WEEKLY = ROOT / "public" / "history_weekly.ndjson"
 HISTORY_DAILY = ROOT / "public" / "history_daily.ndjson"
 MAX_DAYS_DAILY = 420  # ~14 months
 
+# HTTP: every fetch is independent, so they run concurrently and reuse
+# keep-alive connections from a shared per-host pool (TLS handshakes amortize across jobs).
+HTTP_HEADERS = {"User-Agent": "inmetuveritas/1.0", "Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"}
+# Enough workers for every prefetch job to be in flight at once, so the
+# download phase takes about as long as the slowest single request.
+MAX_FETCH_WORKERS = 16
+MAX_REDIRECTS = 3
+HTTP_POOL_MAXSIZE = 8  # idle connections kept per host
+# Transient upstream errors are retried with exponential backoff (0.3s, 0.6s, 1.2s).
+HTTP_RETRIES = 3
+HTTP_BACKOFF_S = 0.3
+HTTP_RETRY_STATUSES = (502, 503, 504)
+# On-disk response cache: bodies are revalidated with If-None-Match / If-Modified-Since
+# every run, so a 304 skips the download but data is never served stale. It can only pay
+# off across runs for URLs that repeat (FRED history windows are pinned to Jan 1 for
+# this), and only if the server's ETag / Last-Modified also holds across days: FRED
+# bodies embed realtime_start/realtime_end (the request date), so that is not a given.
+# Files a run did not use are pruned in main once the fetches are done (prune_http_cache).
+HTTP_CACHE_DIR = ROOT / ".cache" / "http"
+# Response validator header -> conditional request header that echoes it back.
+HTTP_VALIDATORS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
 
 
 # ----------------------------
 # Utilities
 # ----------------------------
 
+ISO_UTC_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    return datetime.now(timezone.utc).strftime(ISO_UTC_FORMAT)
+
+
+# Idle keep-alive connections shared by all worker threads, per (scheme, netloc):
+# a connection goes back to the pool once its response has been fully read.
+_http_pool: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+_http_pool_lock = threading.Lock()
+
+
+def _http_checkout(scheme: str, netloc: str, timeout: int,
+                   fresh: bool = False) -> Tuple[http.client.HTTPConnection, bool]:
+    """
+    Take an idle pooled connection for (scheme, netloc), or open a new one (always when
+    `fresh`). Returns (connection, reused).
+    """
+    if not fresh:
+        with _http_pool_lock:
+            idle = _http_pool.get((scheme, netloc))
+            if idle:
+                return idle.pop(), True
+    cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    return cls(netloc, timeout=timeout), False
+
+
+def _http_checkin(scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+    """Return a reusable connection to the pool (closing it if the pool is full)."""
+    with _http_pool_lock:
+        idle = _http_pool.setdefault((scheme, netloc), [])
+        if len(idle) < HTTP_POOL_MAXSIZE:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+# Cache files looked up or written this run; everything else is dropped by prune_http_cache.
+_http_cache_used: set = set()
+_http_cache_lock = threading.Lock()
+_http_cache_stats: Dict[str, int] = {"hits": 0}  # 304s answered from the cache this run
+
+
+def _cache_paths(url: str) -> Tuple[Path, Path]:
+    """(body, validators) files for url; the name is a hash so API keys never land on disk in clear."""
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    paths = HTTP_CACHE_DIR / f"{key}.body", HTTP_CACHE_DIR / f"{key}.meta"
+    with _http_cache_lock:
+        _http_cache_used.update(paths)
+    return paths
+
+
+def _cache_load(url: str) -> Tuple[Optional[bytes], Dict[str, str]]:
+    body_path, meta_path = _cache_paths(url)
+    try:
+        return body_path.read_bytes(), json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None, {}
+
+
+def _cache_store(url: str, body: bytes, validators: Dict[str, str]) -> None:
+    body_path, meta_path = _cache_paths(url)
+    try:
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(body)
+        meta_path.write_text(json.dumps(validators), encoding="utf-8")
+    except OSError:
+        pass  # cache is best-effort
+
+
+def prune_http_cache() -> int:
+    """
+    Delete cache files no request of this run looked up, so the persisted cache only ever
+    holds the current URL set instead of every URL ever fetched. Returns the number removed.
+    """
+    removed = 0
+    try:
+        entries = list(HTTP_CACHE_DIR.iterdir())
+    except OSError:
+        return 0
+    for path in entries:
+        if path in _http_cache_used:
+            continue
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass  # cache is best-effort
+    return removed
+
+
+def http_get_text(url: str, timeout: int = 20, cache: bool = True) -> str:
+    return http_get_bytes(url, timeout=timeout, cache=cache).decode("utf-8")
+
+
+def _read_body(resp: http.client.HTTPResponse) -> bytes:
+    """Read the whole response body, undoing gzip/deflate Content-Encoding."""
+    encoding = (resp.getheader("Content-Encoding") or "").strip().lower()
+    if encoding == "gzip":
+        # Inflate while reading off the socket: the compressed body is never held in full.
+        return gzip.GzipFile(fileobj=resp).read()
+    body = resp.read()
+    if encoding == "deflate" and body:
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)  # some servers send raw deflate
+    return body
+
+
+def _http_send(conn: http.client.HTTPConnection, scheme: str, netloc: str, path: str,
+               headers: Dict[str, str]) -> Tuple[http.client.HTTPResponse, bytes]:
+    try:
+        conn.request("GET", path, headers=headers)
+        resp = conn.getresponse()
+        body = _read_body(resp)
+    except BaseException:
+        conn.close()
+        raise
+    if resp.will_close:
+        conn.close()
+    else:
+        _http_checkin(scheme, netloc, conn)
+    return resp, body
 
 
-def http_get_text(url: str, timeout: int = 20) -> str:
-    req = urllib.request.Request(url, headers={"User-Agent": "inmetuveritas/1.0"})
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return resp.read().decode("utf-8")
+def _http_roundtrip(scheme: str, netloc: str, path: str, headers: Dict[str, str], timeout: int) -> Tuple[http.client.HTTPResponse, bytes]:
+    """
+    One GET on a pooled keep-alive connection. If a reused socket turns out to be stale,
+    retry once on a brand-new connection; a failure on a new connection is raised as is.
+    """
+    conn, reused = _http_checkout(scheme, netloc, timeout)
+    try:
+        return _http_send(conn, scheme, netloc, path, headers)
+    except (http.client.HTTPException, OSError):
+        if not reused:
+            raise
+    conn, _ = _http_checkout(scheme, netloc, timeout, fresh=True)
+    return _http_send(conn, scheme, netloc, path, headers)
+
+
+def http_get_bytes(url: str, timeout: int = 20, cache: bool = True) -> bytes:
+    """
+    GET url over a reused keep-alive connection, gzip/deflate-compressed on the wire.
+    Follows redirects and retries 502/503/504 with exponential backoff.
+    Revalidates a cached body with If-None-Match / If-Modified-Since (from the stored
+    ETag / Last-Modified) and returns it unchanged on 304. `cache=False` bypasses the
+    disk cache, for URLs that never repeat across runs.
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        cached_body, cached_validators = _cache_load(url) if cache else (None, {})
+        headers = dict(HTTP_HEADERS)
+        if cached_body is not None:
+            for name, value in cached_validators.items():
+                if name in HTTP_VALIDATORS:
+                    headers[HTTP_VALIDATORS[name]] = value
+
+        for attempt in range(HTTP_RETRIES + 1):
+            resp, body = _http_roundtrip(parts.scheme, parts.netloc, path, headers, timeout)
+            if resp.status not in HTTP_RETRY_STATUSES or attempt == HTTP_RETRIES:
+                break
+            time.sleep(HTTP_BACKOFF_S * (2 ** attempt))
+
+        if resp.status in (301, 302, 303, 307, 308) and resp.getheader("Location"):
+            url = urljoin(url, resp.getheader("Location"))
+            continue
+        if resp.status == 304 and cached_body is not None:
+            with _http_cache_lock:
+                _http_cache_stats["hits"] += 1
+            return cached_body
+        if resp.status != 200:
+            raise RuntimeError(f"HTTP {resp.status} {resp.reason} from {parts.netloc}")
+        validators = {name: resp.getheader(name) for name in HTTP_VALIDATORS if resp.getheader(name)}
+        if cache and validators:
+            _cache_store(url, body, validators)
+        return body
+
+    raise RuntimeError(f"too many redirects from {urlsplit(url).netloc}")
+
+
+def fetch_all(jobs: Dict[str, Callable[[], object]]) -> Dict[str, object]:
+    """
+    Run independent fetch jobs concurrently.
+    Returns {key: result}; a job that raised stores its exception (see `fetched`).
+    """
+    results: Dict[str, object] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(len(jobs), MAX_FETCH_WORKERS))) as pool:
+        futures = {key: pool.submit(job) for key, job in jobs.items()}
+        for key, fut in futures.items():
+            try:
+                results[key] = fut.result()
+            except Exception as e:
+                results[key] = e
+    return results
+
+
+def fetched(cache: Dict[str, object], key: str):
+    """Look up a prefetched result, re-raising the fetch error if that job failed."""
+    if key not in cache:
+        raise RuntimeError(f"{key} was not prefetched")
+    v = cache[key]
+    if isinstance(v, Exception):
+        raise v
+    return v
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write via a sibling temp file + os.replace, so readers never see a truncated file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def load_previous_payload() -> Dict:
     """Read yesterday's indicators.json if present (for smoothing / continuity)."""
     if OUTFILE.exists():
         try:
-            return json.loads(OUTFILE.read_text(encoding="utf-8"))
+            return json_loads(OUTFILE.read_bytes())
         except Exception:
             return {}
     return {}
 
 
+def payload_fingerprint(payload: Dict) -> str:
+    """Hash of the cards, ignoring run timestamps (asOf / per-card updatedAt)."""
+    cards = [{k: v for k, v in c.items() if k != "updatedAt"} for c in payload.get("cards", [])]
+    return hashlib.sha256(json_dumps_compact(cards, sort_keys=True)).hexdigest()
+
+
 def prev_card_value(prev_payload: Dict, card_id: str) -> Optional[float]:
     """Get previous numeric 'value' for a given card id, if available."""
     try:
@@ -97,7 +368,7 @@ def parse_iso_date(iso_ts: str) -> date:
         dt = datetime.fromisoformat(s)
     except Exception:
         # Fallback: just take YYYY-MM-DD prefix
-        return _to_date(s[:10])
+        return date.fromisoformat(s[:10])
     return dt.astimezone(timezone.utc).date()
 
 
@@ -112,12 +383,12 @@ def load_weekly_history() -> List[Dict]:
         return []
     rows: List[Dict] = []
     try:
-        for line in HISTORY_WEEKLY.read_text(encoding="utf-8").splitlines():
+        for line in HISTORY_WEEKLY.read_bytes().splitlines():
             line = line.strip()
             if not line:
                 continue
             try:
-                rows.append(json.loads(line))
+                rows.append(json_loads(line))
             except Exception:
                 continue
     except Exception:
@@ -134,20 +405,27 @@ def upsert_weekly_history(week_key: str, row: Dict, keep_last: int = 80) -> None
     if keep_last and len(rows) > keep_last:
         rows = rows[-keep_last:]
 
-    HISTORY_WEEKLY.parent.mkdir(parents=True, exist_ok=True)
-    with HISTORY_WEEKLY.open("w", encoding="utf-8") as f:
-        for r in rows:
-            f.write(json.dumps(r, separators=(",", ":")) + "\n")
+    write_atomic(HISTORY_WEEKLY, b"".join(json_dumps_compact(r) + b"\n" for r in rows))
 
 
 # ----------------------------
 # Stooq (prices) helpers
 # ----------------------------
 
-@dataclass
-class PriceBar:
-    date: str
-    close: float
+STOOQ_DAILY_URL = "https://stooq.com/q/d/l/?s={symbol}&i=d"
+STOOQ_RANGE_PARAMS = "&d1={start:%Y%m%d}&d2={end:%Y%m%d}"
+
+@dataclass(frozen=True, slots=True)
+class PriceSeries:
+    """
+    Column-oriented daily closes: parallel ISO dates and closes, ascending by date.
+    `closes` is a packed float64 array (8 bytes/close, contiguous) rather than float objects.
+    """
+    dates: Tuple[str, ...] = ()
+    closes: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        return len(self.dates)
 
 
 def load_daily_history() -> List[Dict]:
@@ -156,12 +434,12 @@ def load_daily_history() -> List[Dict]:
     try:
         if not HISTORY_DAILY.exists():
             return []
-        for line in HISTORY_DAILY.read_text(encoding="utf-8").splitlines():
+        for line in HISTORY_DAILY.read_bytes().splitlines():
             s = line.strip()
             if not s:
                 continue
             try:
-                rows.append(json.loads(s))
+                rows.append(json_loads(s))
             except Exception:
                 continue
     except Exception:
@@ -175,44 +453,66 @@ def upsert_daily_history(date_key: str, row: Dict, keep_last: int = MAX_DAYS_DAI
     rows.append({"date": date_key, **row})
     rows.sort(key=lambda r: r.get("date", ""))
     rows = rows[-keep_last:]
-    HISTORY_DAILY.parent.mkdir(parents=True, exist_ok=True)
-    with HISTORY_DAILY.open("w", encoding="utf-8") as f:
-        for r in rows:
-            f.write(json.dumps(r, separators=(",", ":")) + "\n")
+    write_atomic(HISTORY_DAILY, b"".join(json_dumps_compact(r) + b"\n" for r in rows))
 
 
-def stooq_daily_closes(symbol: str) -> List[PriceBar]:
+def stooq_daily_closes(symbol: str, start: Optional[date] = None, end: Optional[date] = None) -> PriceSeries:
     """
-    Fetch daily OHLC from Stooq CSV and return closes sorted ascending by date.
+    Fetch daily OHLC from Stooq CSV and return closes sorted ascending by date,
+    optionally only bars dated start..end (Stooq's d1/d2); otherwise the full history.
     Example symbols:
       - "spy.us" for SPY ETF
       - "kre.us" for KRE ETF
     """
-    url = f"https://stooq.com/q/d/l/?s={symbol}&i=d"
-    txt = http_get_text(url)
-    # Stooq returns "No data" sometimes; csv.DictReader will then yield no rows.
-    rows = list(csv.DictReader(txt.splitlines()))
-    bars: List[PriceBar] = []
-    for r in rows:
-        try:
-            bars.append(PriceBar(date=r["Date"], close=float(r["Close"])))
-        except Exception:
-            continue
-    bars.sort(key=lambda b: b.date)
-    return bars
-
-
-def drawdown_pct(bars: List[PriceBar], lookback_days: int) -> Optional[float]:
+    url = STOOQ_DAILY_URL.format(symbol=symbol)
+    ranged = bool(start and end)
+    if ranged:
+        url += STOOQ_RANGE_PARAMS.format(start=start, end=end)
+    # A ranged URL ends on today's date, so it never recurs across runs: keep it out of the cache.
+    lines = http_get_text(url, cache=not ranged).splitlines()
+    # Stooq CSV is unquoted, so a plain split is enough; "No data" has no Date/Close header.
+    header = lines[0].split(",") if lines else []
+    try:
+        date_i, close_i = header.index("Date"), header.index("Close")
+    except ValueError:
+        return PriceSeries()
+    rows = [line.split(",") for line in lines[1:] if line]
+    try:
+        # Fast path: one C-level float() pass straight into the packed close column.
+        dates = [cols[date_i] for cols in rows]
+        closes = array("d", map(float, [cols[close_i] for cols in rows]))
+    except (IndexError, ValueError):
+        # A short row or non-numeric close (e.g. "-"): fall back to a tolerant per-row parse.
+        dates, closes = [], array("d")
+        width = max(date_i, close_i)
+        for cols in rows:
+            if len(cols) <= width:
+                continue
+            try:
+                c = float(cols[close_i])
+            except ValueError:
+                continue
+            dates.append(cols[date_i])
+            closes.append(c)
+    if not dates:
+        return PriceSeries()
+    # Stooq already serves oldest-first; only flip if that ever changes.
+    if len(dates) >= 2 and dates[0] > dates[-1]:
+        dates.reverse()
+        closes.reverse()
+    return PriceSeries(tuple(dates), closes)
+
+
+def drawdown_pct(closes: Sequence[float], lookback_days: int) -> Optional[float]:
     """
     Drawdown from the max close in the last lookback_days to the latest close.
     Returns negative percent (e.g., -6.2) or 0 if at highs.
     """
-    if len(bars) < max(5, lookback_days):
+    if len(closes) < max(5, lookback_days):
         return None
-    window = bars[-lookback_days:]
-    closes = [b.close for b in window]
-    peak = max(closes)
-    last = closes[-1]
+    window = closes[-lookback_days:]
+    peak = max(window)
+    last = window[-1]
     if peak <= 0:
         return None
     dd = (last / peak - 1.0) * 100.0
@@ -223,74 +523,116 @@ def drawdown_pct(bars: List[PriceBar], lookback_days: int) -> Optional[float]:
 # FRED helpers
 # ----------------------------
 
-def fred_latest(series_id: str, api_key: Optional[str]) -> Optional[Tuple[str, float]]:
+FRED_MISSING = (".", "", None)
+FRED_OBSERVATIONS_URL = ("https://api.stlouisfed.org/fred/series/observations"
+                         "?series_id={series_id}&file_type=json&sort_order={sort_order}&limit={limit}")
+
+
+@dataclass(frozen=True, slots=True)
+class FredSeries:
+    """Column-oriented FRED series: parallel ISO dates and float values, ascending by date."""
+    dates: Tuple[str, ...] = ()
+    values: Tuple[float, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+
+def parse_observations(obs: List[Dict]) -> FredSeries:
+    """Split FRED observations into (dates, values) columns, dropping missing values."""
+    valid = [o for o in obs if o.get("value", ".") not in FRED_MISSING]
+    try:
+        # Fast path: one C-level float() pass over the value column.
+        values = tuple(map(float, [o["value"] for o in valid]))
+        dates = tuple([o.get("date", "") for o in valid])
+    except (TypeError, ValueError):
+        # Rare non-numeric value: fall back to a tolerant per-row parse.
+        d_col: List[str] = []
+        v_col: List[float] = []
+        for o in valid:
+            try:
+                v_col.append(float(o["value"]))
+            except Exception:
+                continue
+            d_col.append(o.get("date", ""))
+        dates, values = tuple(d_col), tuple(v_col)
+    if len(dates) > 1 and dates[0] > dates[-1]:
+        dates, values = dates[::-1], values[::-1]
+    return FredSeries(dates, values)
+
+
+@lru_cache(maxsize=64)
+def fred_series(series_id: str, api_key: Optional[str], limit: int = 6000, sort_order: str = "asc",
+                observation_start: Optional[str] = None) -> FredSeries:
     """
-    Fetch latest *valid* observation for a FRED series_id.
-    Returns (date, value) or None if unavailable.
+    Memoized `_fred_series_uncached`: repeated requests for the same
+    (series_id, limit, sort_order, observation_start) in one run share a single download.
+    FredSeries is immutable, so cached results can't be mutated by callers.
+    """
+    return _fred_series_uncached(series_id, api_key, limit=limit, sort_order=sort_order,
+                                 observation_start=observation_start)
+
 
-    We request multiple observations then pick the first non-missing value,
-    because sometimes the latest observation can be ".".
+def _fred_series_uncached(series_id: str, api_key: Optional[str], limit: int = 6000, sort_order: str = "asc",
+                          observation_start: Optional[str] = None) -> FredSeries:
     """
-    base = "https://api.stlouisfed.org/fred/series/observations"
-    params = f"?series_id={series_id}&file_type=json&sort_order=desc&limit=10"
+    Fetch up to `limit` observations for a FRED series, optionally only those
+    on/after `observation_start` (YYYY-MM-DD).
+    Returns a FredSeries sorted ascending by date.
+    """
+    url = FRED_OBSERVATIONS_URL.format(series_id=series_id, sort_order=sort_order, limit=limit)
+    if observation_start:
+        url += f"&observation_start={observation_start}"
     if api_key:
-        params += f"&api_key={api_key}"
-    url = base + params
+        url += f"&api_key={api_key}"
 
-    try:
-        data = json.loads(http_get_text(url))
-        obs = data.get("observations", [])
-        if not obs:
-            return None
-
-        for o in obs:
-            v = o.get("value", ".")
-            if v in (".", "", None):
-                continue
-            return (o.get("date", ""), float(v))
+    data = json_loads(http_get_bytes(url))
+    return parse_observations(data.get("observations", []))
 
+
+def latest_observation(series: FredSeries) -> Optional[Tuple[str, float]]:
+    """(date, value) of the most recent valid observation, or None for an empty series."""
+    if not series:
         return None
-    except Exception:
-        return None
+    return series.dates[-1], series.values[-1]
 
 
-def fred_series(series_id: str, api_key: Optional[str], limit: int = 6000, sort_order: str = "asc") -> List[Tuple[str, float]]:
+def fred_recent(series_id: str, api_key: Optional[str], days: int, fallback_limit: int) -> FredSeries:
     """
-    Fetch up to `limit` observations for a FRED series.
-    Returns list of (date, value) sorted ascending by date (default).
+    At least the last `days` days of a FRED series, for cards that show just the latest value.
+    An ascending observation_start window is cheap for FRED to serve; it starts on a Monday
+    so the URL (the HTTP cache key) holds for a week. If it holds no valid observation
+    (publication gap), fall back to the newest `fallback_limit` observations.
     """
-    base = "https://api.stlouisfed.org/fred/series/observations"
-    params = f"?series_id={series_id}&file_type=json&sort_order={sort_order}&limit={limit}"
-    if api_key:
-        params += f"&api_key={api_key}"
-    url = base + params
-
-    data = json.loads(http_get_text(url))
-    out: List[Tuple[str, float]] = []
-    for o in data.get("observations", []):
-        v = o.get("value", ".")
-        if v in (".", "", None):
-            continue
-        try:
-            out.append((o.get("date", ""), float(v)))
-        except Exception:
-            continue
-    out.sort(key=lambda x: x[0])
-    return out
+    start = datetime.now(timezone.utc).date() - timedelta(days=days)
+    start -= timedelta(days=start.weekday())
+    # At most one observation per day, so this limit never cuts the (<= days + 7) window short.
+    series = fred_series(series_id, api_key, limit=days + 7, observation_start=start.isoformat())
+    if series:
+        return series
+    return fred_series(series_id, api_key, limit=fallback_limit, sort_order="desc")
 
 
-def _to_date(s: str) -> date:
-    y, m, d = s.split("-")
-    return date(int(y), int(m), int(d))
+def years_before(d: date, years: int) -> date:
+    """Same calendar day `years` earlier (Feb 29 falls back to Feb 28)."""
+    try:
+        return d.replace(year=d.year - years)
+    except ValueError:
+        return d.replace(year=d.year - years, day=28)
 
 
-def tail_since(series: List[Tuple[str, float]], years: int = 10) -> List[Tuple[str, float]]:
-    """Keep last N years using a date cutoff."""
+def tail_since(series: FredSeries, years: int = 10) -> FredSeries:
+    """
+    Keep last N years using a date cutoff.
+    Dates are sorted ISO strings, so the cutoff is found by binary search on the strings;
+    only the last date is ever parsed.
+    """
     if not series:
         return series
-    last_d = _to_date(series[-1][0])
-    cutoff = last_d.replace(year=last_d.year - years)
-    return [(d, v) for (d, v) in series if _to_date(d) >= cutoff]
+    last_d = date.fromisoformat(series.dates[-1])
+    cutoff = years_before(last_d, years).isoformat()
+    start = bisect.bisect_left(series.dates, cutoff)
+    return FredSeries(series.dates[start:], series.values[start:])
 
 
 # ----------------------------
@@ -323,49 +665,65 @@ def status_from_band(value: float, good_max: float, warn_max: float, higher_is_w
         return "DELAYED"
 
 
-def percentile_score(current: float, history_vals: List[float], invert: bool = False) -> float:
+def percentile_score(current: float, sorted_vals: Sequence[float], invert: bool = False) -> float:
     """
     Map current value to 0-100 percentile in history.
+    `sorted_vals` must already be sorted ascending; sort once per series, not per lookup.
     invert=True means lower is worse (e.g., curve slope), so low values map to high scores.
     """
-    if not history_vals:
+    if not sorted_vals:
         return 50.0
-    vals = sorted(history_vals)
-    r = bisect.bisect_right(vals, current) / len(vals)  # fraction <= current
+    r = bisect.bisect_right(sorted_vals, current) / len(sorted_vals)  # fraction <= current
     if invert:
         r = 1.0 - r
     return clamp(r * 100.0, 0.0, 100.0)
 
 
-def smooth_with_previous(current: float, prev: Optional[float], alpha: float = 0.20) -> float:
+# EWMA constant for the composite dials; alpha~0.2 gives a calm-ish dial without becoming too laggy.
+SMOOTH_ALPHA = 0.20
+
+
+def smooth_with_previous(current: float, prev: Optional[float], alpha: float = SMOOTH_ALPHA) -> float:
     """
-    Simple EWMA smoothing: new = alpha*current + (1-alpha)*prev
-    alpha~0.2 gives a calm-ish dial without becoming too laggy.
+    Simple EWMA smoothing (streaming, one step): new = alpha*current + (1-alpha)*prev
     """
     if prev is None:
         return current
     return alpha * current + (1.0 - alpha) * prev
 
 
-def align_by_date(a: List[Tuple[str, float]], b: List[Tuple[str, float]]) -> List[Tuple[str, float, float]]:
-    """Inner join by date on two (date,val) series."""
-    db = {d: v for d, v in b}
-    out = []
-    for d, va in a:
-        vb = db.get(d)
-        if vb is None:
-            continue
-        out.append((d, va, vb))
-    return out
+def ema_vector(xs: Sequence[float], alpha: float = SMOOTH_ALPHA) -> Optional[float]:
+    """
+    Closed-form EWMA of xs (oldest first), equal to folding smooth_with_previous over
+    xs seeded with xs[0]: weights are (1-a)^t for xs[0], then a*(1-a)^(t-i) for xs[i].
+    For batch recomputes (e.g. backfilling history); returns None for empty xs.
+    """
+    if not xs:
+        return None
+    keep = 1.0 - alpha
+    t = len(xs) - 1
+    weights = [keep ** t] + [alpha * keep ** (t - i) for i in range(1, t + 1)]
+    return sum(map(operator.mul, weights, xs))
+
+
+def align_by_date(a: FredSeries, b: FredSeries) -> Tuple[Tuple[str, ...], Tuple[float, ...], Tuple[float, ...]]:
+    """Inner join by date on two series -> (dates, a_values, b_values) columns."""
+    db = dict(zip(b.dates, b.values))
+    rows = [(d, va, db[d]) for d, va in zip(a.dates, a.values) if d in db]
+    if not rows:
+        return (), (), ()
+    dates, a_vals, b_vals = zip(*rows)
+    return dates, a_vals, b_vals
 
 
 # ----------------------------
 # Composite dial builders
 # ----------------------------
 
-def build_recession_dial(fred_key: Optional[str]) -> Tuple[Optional[float], str, List[str], Dict]:
+def build_recession_dial(history: Dict[str, object]) -> Tuple[Optional[float], str, List[str], Dict]:
     """
     Returns (score_0_100, tooltip, warnings, details)
+    `history` is the pre-windowed, pre-sorted dict from `prepare_history`; no I/O here.
 
     Practical composite:
       - Curve stress: inverted percentile of 10y-3m (T10Y3M) [leading]
@@ -385,13 +743,11 @@ def build_recession_dial(fred_key: Optional[str]) -> Tuple[Optional[float], str,
     # 1) Curve: 10y-3m
     curve_score: Optional[float]
     try:
-        curve_series = tail_since(fred_series("T10Y3M", fred_key, limit=6000), years=15)
-        if not curve_series:
+        curve_h = fetched(history, "T10Y3M")
+        if not curve_h.series:
             raise RuntimeError("empty series")
-        curve_vals = [v for _, v in curve_series]
-        _, curve_now = curve_series[-1]
-        curve_now = float(curve_now)
-        curve_score = percentile_score(curve_now, curve_vals, invert=True)
+        curve_now = float(curve_h.series.values[-1])
+        curve_score = percentile_score(curve_now, curve_h.sorted_values, invert=True)
     except Exception as e:
         curve_score = None
         warnings.append(f"Curve(T10Y3M) unavailable: {e}")
@@ -399,11 +755,10 @@ def build_recession_dial(fred_key: Optional[str]) -> Tuple[Optional[float], str,
     # 2) Sahm Rule realtime
     sahm_score: Optional[float]
     try:
-        sahm_series = tail_since(fred_series("SAHMREALTIME", fred_key, limit=5000), years=20)
+        sahm_series = fetched(history, "SAHMREALTIME").series
         if not sahm_series:
             raise RuntimeError("empty series")
-        _, sahm_now = sahm_series[-1]
-        sahm_now = float(sahm_now)
+        sahm_now = float(sahm_series.values[-1])
         sahm_score = clamp((sahm_now / 1.0) * 100.0, 0.0, 100.0)
     except Exception as e:
         sahm_score = None
@@ -412,11 +767,10 @@ def build_recession_dial(fred_key: Optional[str]) -> Tuple[Optional[float], str,
     # 3) Coincident-ish recession probability
     coin_score: Optional[float]
     try:
-        recp_series = tail_since(fred_series("RECPROUSM156N", fred_key, limit=5000), years=20)
+        recp_series = fetched(history, "RECPROUSM156N").series
         if not recp_series:
             raise RuntimeError("empty series")
-        _, recp_now = recp_series[-1]
-        recp_now = float(recp_now)
+        recp_now = float(recp_series.values[-1])
         coin_score = clamp(recp_now, 0.0, 100.0)
     except Exception as e:
         coin_score = None
@@ -467,9 +821,10 @@ def build_recession_dial(fred_key: Optional[str]) -> Tuple[Optional[float], str,
     return clamp(score, 0.0, 100.0), tooltip, warnings, details
 
 
-def build_credit_stress_dial(fred_key: Optional[str]) -> Tuple[Optional[float], str, List[str], Dict]:
+def build_credit_stress_dial(history: Dict[str, object]) -> Tuple[Optional[float], str, List[str], Dict]:
     """
-    Composite 0-100 credit stress using percentiles over ~15y history:
+    Composite 0-100 credit stress using percentiles over ~15y history
+    (series come pre-windowed and pre-sorted from `prepare_history`):
       - HY OAS (BAMLH0A0HYM2)       30%
       - BBB OAS (BAMLC0A4CBBB)     10%
       - HY-IG differential          10%
@@ -482,41 +837,38 @@ def build_credit_stress_dial(fred_key: Optional[str]) -> Tuple[Optional[float],
     """
     warnings: List[str] = []
 
-    def get_pct_score(series_id: str, years: int = 15) -> Tuple[Optional[float], Optional[float]]:
+    def get_pct_score(series_id: str) -> Tuple[Optional[float], Optional[float]]:
         try:
-            s = tail_since(fred_series(series_id, fred_key, limit=6000), years=years)
-            if not s:
+            h = fetched(history, series_id)
+            if not h.series:
                 return None, None
-            vals = [v for _, v in s]
-            _, now = s[-1]
-            now = float(now)
-            return percentile_score(now, vals, invert=False), now
+            now = float(h.series.values[-1])
+            return percentile_score(now, h.sorted_values, invert=False), now
         except Exception as e:
             warnings.append(f"{series_id} unavailable: {e}")
             return None, None
 
-    hy_score, hy_now = get_pct_score("BAMLH0A0HYM2", years=15)
-    bbb_score, bbb_now = get_pct_score("BAMLC0A4CBBB", years=15)
+    hy_score, hy_now = get_pct_score("BAMLH0A0HYM2")
+    bbb_score, bbb_now = get_pct_score("BAMLC0A4CBBB")
 
     # HY-IG differential
     hy_ig_score: Optional[float] = None
     hy_ig_now: Optional[float] = None
     try:
-        hy_s = tail_since(fred_series("BAMLH0A0HYM2", fred_key, limit=6000), years=15)
-        ig_s = tail_since(fred_series("BAMLC0A0CM", fred_key, limit=6000), years=15)
-        joined = align_by_date(hy_s, ig_s)
-        diffs = [(d, (hy - ig)) for (d, hy, ig) in joined]
+        hy_s = fetched(history, "BAMLH0A0HYM2").series
+        ig_s = fetched(history, "BAMLC0A0CM").series
+        _, hy_vals, ig_vals = align_by_date(hy_s, ig_s)
+        diffs = list(map(operator.sub, hy_vals, ig_vals))
         if diffs:
-            vals = [v for _, v in diffs]
-            _, now = diffs[-1]
+            now = diffs[-1]
             hy_ig_now = float(now)
-            hy_ig_score = percentile_score(now, vals, invert=False)
+            hy_ig_score = percentile_score(now, sorted(diffs), invert=False)
     except Exception as e:
         warnings.append(f"HY-IG diff unavailable: {e}")
 
-    cpff_score, cpff_now = get_pct_score("CPFF", years=15)
-    stlfsi_score, stlfsi_now = get_pct_score("STLFSI4", years=15)
-    nfci_risk_score, nfci_risk_now = get_pct_score("NFCIRISK", years=15)
+    cpff_score, cpff_now = get_pct_score("CPFF")
+    stlfsi_score, stlfsi_now = get_pct_score("STLFSI4")
+    nfci_risk_score, nfci_risk_now = get_pct_score("NFCIRISK")
 
     weights = [
         ("HY OAS", hy_score, 0.30),
@@ -537,14 +889,12 @@ def build_credit_stress_dial(fred_key: Optional[str]) -> Tuple[Optional[float],
 
     # Momentum kicker: HY OAS widening over ~1 month
     try:
-        hy_s = tail_since(fred_series("BAMLH0A0HYM2", fred_key, limit=6000), years=15)
-        if len(hy_s) > 40:
-            now = hy_s[-1][1]
-            prev = hy_s[-31][1]  # rough 1 month (calendar obs in daily series)
+        hy_vals = fetched(history, "BAMLH0A0HYM2").series.values
+        if len(hy_vals) > 40:
+            now = hy_vals[-1]
+            prev = hy_vals[-31]  # rough 1 month (calendar obs in daily series)
             chg = now - prev
-            chgs = []
-            for i in range(31, len(hy_s)):
-                chgs.append(hy_s[i][1] - hy_s[i - 31][1])
+            chgs = sorted([b - a for a, b in zip(hy_vals, hy_vals[31:])])
             pct = percentile_score(chg, chgs, invert=False)
             mom_details = {"chg_1m": float(chg), "pct_rank": float(pct)}
             if pct >= 90.0:
@@ -582,209 +932,249 @@ def build_credit_stress_dial(fred_key: Optional[str]) -> Tuple[Optional[float],
 # Main dial construction
 # ----------------------------
 
+# Everything make_cards reads, fetched up-front and concurrently by `prefetch`.
+# Series only shown as a latest value. Their "latest" comes from the last couple of weeks
+# (the newest observation can be "."); the others reuse their history fetch.
+FRED_LATEST_ONLY_IDS = ("VIXCLS", "T10Y2Y")
+FRED_LATEST_WINDOW_DAYS = 14
+FRED_LATEST_FALLBACK = 10
+# FRED history: id -> years of history the dial scores against.
+FRED_HISTORY = {
+    "T10Y3M": 15,
+    "SAHMREALTIME": 20,
+    "RECPROUSM156N": 20,
+    "BAMLH0A0HYM2": 15,
+    "BAMLC0A0CM": 15,
+    "BAMLC0A4CBBB": 15,
+    "CPFF": 15,
+    "STLFSI4": 15,
+    "NFCIRISK": 15,
+}
+# Extra history requested beyond the scoring window, so tail_since (which anchors on
+# the series' last observation, not today) still sees its full window for lagging series.
+# The request starts on Jan 1 of that year, so the URL (the HTTP cache key) stays the same
+# all year and an unchanged series can revalidate to a 304 if FRED's validators allow;
+# tail_since does the exact cut.
+FRED_HISTORY_MARGIN_YEARS = 1
+# Stooq: symbol -> trading days the cards read (1M drawdown / 20d return, 3M drawdown).
+STOOQ_HISTORY = {"spy.us": 21, "rsp.us": 21, "kre.us": 63}
+# Calendar days per trading day requested (weekends + holidays), plus a fixed pad
+# so a late bar or a long holiday stretch still leaves the full window.
+STOOQ_CALENDAR_RATIO = 1.6
+STOOQ_MARGIN_DAYS = 10
+
+
+def prefetch(fred_key: Optional[str]) -> Dict[str, object]:
+    """
+    Download every series the dials need in parallel, one request per series.
+    Keys: "<FRED id>" (FredSeries) and "<stooq symbol>".
+    """
+    today = datetime.now(timezone.utc).date()
+    jobs: Dict[str, Callable[[], object]] = {}
+    for series_id in FRED_LATEST_ONLY_IDS:
+        jobs[series_id] = partial(fred_recent, series_id, fred_key, FRED_LATEST_WINDOW_DAYS, FRED_LATEST_FALLBACK)
+    for series_id, years in FRED_HISTORY.items():
+        start = date(today.year - years - FRED_HISTORY_MARGIN_YEARS, 1, 1)
+        # At most one observation per day through year end: an ascending limit can never drop
+        # the newest rows, and like the start it only changes once a year.
+        limit = (date(today.year, 12, 31) - start).days + 1
+        jobs[series_id] = partial(fred_series, series_id, fred_key, limit=limit, observation_start=start.isoformat())
+    for symbol, trading_days in STOOQ_HISTORY.items():
+        start = today - timedelta(days=int(trading_days * STOOQ_CALENDAR_RATIO) + STOOQ_MARGIN_DAYS)
+        jobs[symbol] = partial(stooq_daily_closes, symbol, start, today)
+    return fetch_all(jobs)
+
+
+@dataclass(frozen=True, slots=True)
+class SeriesHistory:
+    """A FRED series cut to its scoring window, plus its values sorted once for percentile lookups."""
+    series: FredSeries
+    sorted_values: Tuple[float, ...]
+
+
+def prepare_history(cache: Dict[str, object]) -> Dict[str, object]:
+    """
+    Window (tail_since) and sort every FRED_HISTORY series exactly once.
+    Like the prefetch cache, a failed series stores its exception (read with `fetched`).
+    """
+    history: Dict[str, object] = {}
+    for series_id, years in FRED_HISTORY.items():
+        try:
+            s = tail_since(fetched(cache, series_id), years=years)
+            history[series_id] = SeriesHistory(s, tuple(sorted(s.values)))
+        except Exception as e:
+            history[series_id] = e
+    return history
+
+
+def cached_latest(cache: Dict[str, object], series_id: str) -> Optional[Tuple[str, float]]:
+    """Latest (date, value) of a prefetched FRED series, or None if it failed or is empty."""
+    try:
+        return latest_observation(fetched(cache, series_id))
+    except Exception:
+        return None
+
+
+def gauge_card(card_id: str, title: str, status: str, value: float, unit: str, lo: float, hi: float,
+               labels: Tuple[str, str, str], tooltip: str, as_of: str, details: Optional[Dict] = None) -> Dict:
+    """A populated gauge card. `labels` is (minLabel, midLabel, maxLabel)."""
+    card = {
+        "id": card_id,
+        "type": "gauge",
+        "title": title,
+        "status": status,
+        "value": value,
+        "unit": unit,
+        "min": lo,
+        "max": hi,
+        "minLabel": labels[0],
+        "midLabel": labels[1],
+        "maxLabel": labels[2],
+        "tooltip": tooltip,
+    }
+    if details is not None:
+        card["details"] = details
+    card["updatedAt"] = as_of
+    return card
+
+
+def delayed_card(card_id: str, title: str, value_text: str, labels: Optional[Tuple[str, str, str]],
+                 tooltip: str, as_of: str) -> Dict:
+    """Placeholder gauge card for a dial that could not be built (DELAYED, needle centred)."""
+    card = {
+        "id": card_id,
+        "type": "gauge",
+        "title": title,
+        "status": "DELAYED",
+        "valueText": value_text,
+        "pct": 50,
+    }
+    if labels is not None:
+        card["minLabel"], card["midLabel"], card["maxLabel"] = labels
+    card["tooltip"] = tooltip
+    card["updatedAt"] = as_of
+    return card
+
+
+@dataclass(frozen=True, slots=True)
+class FredLatestCard:
+    """A gauge showing the latest value of one FRED series, scaled (e.g. % -> bp) and banded."""
+    card_id: str
+    title: str
+    series_id: str
+    labels: Tuple[str, str, str]
+    lo: float
+    hi: float
+    unit: str
+    scale: float
+    digits: int
+    good_max: float
+    warn_max: float
+    higher_is_worse: bool
+    tooltip: str
+
+
+FRED_LATEST_CARDS = (
+    FredLatestCard("vix", "VOLATILITY (VIX)", "VIXCLS", ("10", "20", "40"), 10, 40, "", 1.0, 1,
+                   good_max=18, warn_max=28, higher_is_worse=True,
+                   tooltip="CBOE VIX close from FRED (VIXCLS). Higher = riskier."),
+    FredLatestCard("hy_oas", "HIGH YIELD SPREAD (OAS)", "BAMLH0A0HYM2", ("250", "500", "800"), 250, 800, " bp", 100.0, 0,
+                   good_max=350, warn_max=500, higher_is_worse=True,
+                   tooltip="HY OAS from FRED (ICE BofA). Higher = tighter financial conditions / more stress."),
+    FredLatestCard("ig_oas", "INVESTMENT GRADE SPREAD (OAS)", "BAMLC0A0CM", ("80", "180", "300"), 80, 300, " bp", 100.0, 0,
+                   good_max=130, warn_max=200, higher_is_worse=True,
+                   tooltip="IG OAS from FRED (ICE BofA). Higher = tighter conditions / credit stress."),
+    FredLatestCard("curve_10y2y", "YIELD CURVE (10Y–2Y)", "T10Y2Y", ("-200", "0", "200"), -200, 200, " bp", 100.0, 0,
+                   good_max=0, warn_max=-50, higher_is_worse=False,
+                   tooltip="10Y–2Y spread from FRED. More negative (inversion) = growth risk signal."),
+)
+
+
+def fred_latest_card(spec: FredLatestCard, cache: Dict[str, object], as_of: str) -> Dict:
+    latest = cached_latest(cache, spec.series_id)
+    if not latest:
+        return delayed_card(
+            spec.card_id, spec.title, "FRED key?", spec.labels,
+            f"Could not fetch FRED series {spec.series_id}. Set env var FRED_API_KEY.", as_of)
+    obs_date, obs_value = latest
+    value = obs_value * spec.scale
+    tooltip = spec.tooltip
+    if date.fromisoformat(obs_date) < date.fromisoformat(as_of[:10]) - timedelta(days=FRED_LATEST_WINDOW_DAYS):
+        tooltip += f" Last FRED observation: {obs_date}."
+    return gauge_card(
+        spec.card_id, spec.title,
+        status_from_band(value, good_max=spec.good_max, warn_max=spec.warn_max, higher_is_worse=spec.higher_is_worse),
+        round(value, spec.digits), spec.unit, spec.lo, spec.hi, spec.labels, tooltip, as_of)
+
+
+@dataclass(frozen=True, slots=True)
+class DrawdownCard:
+    """A gauge of a Stooq symbol's drawdown from its peak over the last `lookback_days` closes."""
+    card_id: str
+    title: str
+    symbol: str
+    lookback_days: int
+    labels: Tuple[str, str, str]
+    lo: float
+    warn_at: float
+    bad_at: float
+    tooltip: str
+
+
+SPY_DRAWDOWN_CARD = DrawdownCard(
+    "spy_dd_1m", "EQUITY DRAWDOWN (SPY, 1M)", "spy.us", 21, ("-20%", "-10%", "0%"), -20, warn_at=-6, bad_at=-10,
+    tooltip="SPY drawdown from 1M peak (21 trading days). More negative = risk-off.")
+KRE_DRAWDOWN_CARD = DrawdownCard(
+    "kre_dd_3m", "REGIONAL BANKS DRAWDOWN (KRE, 3M)", "kre.us", 63, ("-30%", "-15%", "0%"), -30, warn_at=-8, bad_at=-15,
+    tooltip="KRE drawdown from 3M peak (63 trading days). More negative = bank stress proxy.")
+
+
+def drawdown_card(spec: DrawdownCard, cache: Dict[str, object], as_of: str) -> Dict:
+    ticker = spec.symbol.split(".")[0].upper()
+    try:
+        dd = drawdown_pct(fetched(cache, spec.symbol).closes, lookback_days=spec.lookback_days)
+        if dd is None:
+            raise RuntimeError(f"not enough {ticker} data")
+    except Exception as e:
+        return delayed_card(spec.card_id, spec.title, "—", spec.labels, f"{ticker} fetch failed: {e}", as_of)
+    status = "GOOD"
+    if dd <= spec.warn_at:
+        status = "WARN"
+    if dd <= spec.bad_at:
+        status = "DELAYED"
+    return gauge_card(spec.card_id, spec.title, status, round(dd, 1), "%", spec.lo, 0, spec.labels, spec.tooltip, as_of)
+
+
 def make_cards() -> Dict:
     as_of = utc_now_iso()
     fred_key = os.environ.get("FRED_API_KEY", "").strip() or None
     prev_payload = load_previous_payload()
+    cache = prefetch(fred_key)
+    history = prepare_history(cache)
 
     cards = []
 
-    # 1) VIX (FRED: VIXCLS)
-    vix = fred_latest("VIXCLS", fred_key)
-    if vix:
-        _, vix_val = vix
-        cards.append({
-            "id": "vix",
-            "type": "gauge",
-            "title": "VOLATILITY (VIX)",
-            "status": status_from_band(vix_val, good_max=18, warn_max=28, higher_is_worse=True),
-            "value": round(vix_val, 1),
-            "unit": "",
-            "min": 10,
-            "max": 40,
-            "minLabel": "10",
-            "midLabel": "20",
-            "maxLabel": "40",
-            "tooltip": "CBOE VIX close from FRED (VIXCLS). Higher = riskier.",
-            "updatedAt": as_of
-        })
-    else:
-        cards.append({
-            "id": "vix",
-            "type": "gauge",
-            "title": "VOLATILITY (VIX)",
-            "status": "DELAYED",
-            "valueText": "FRED key?",
-            "pct": 50,
-            "minLabel": "10",
-            "midLabel": "20",
-            "maxLabel": "40",
-            "tooltip": "Could not fetch FRED series VIXCLS. Check env var FRED_API_KEY.",
-            "updatedAt": as_of
-        })
-
-    # 2) HY OAS (FRED)
-    hy = fred_latest("BAMLH0A0HYM2", fred_key)
-    if hy:
-        _, hy_val = hy
-        hy_bp = hy_val * 100.0
-        cards.append({
-            "id": "hy_oas",
-            "type": "gauge",
-            "title": "HIGH YIELD SPREAD (OAS)",
-            "status": status_from_band(hy_bp, good_max=350, warn_max=500, higher_is_worse=True),
-            "value": round(hy_bp, 0),
-            "unit": " bp",
-            "min": 250,
-            "max": 800,
-            "minLabel": "250",
-            "midLabel": "500",
-            "maxLabel": "800",
-            "tooltip": "HY OAS from FRED (ICE BofA). Higher = tighter financial conditions / more stress.",
-            "updatedAt": as_of
-        })
-    else:
-        cards.append({
-            "id": "hy_oas",
-            "type": "gauge",
-            "title": "HIGH YIELD SPREAD (OAS)",
-            "status": "DELAYED",
-            "valueText": "FRED key?",
-            "pct": 50,
-            "minLabel": "250",
-            "midLabel": "500",
-            "maxLabel": "800",
-            "tooltip": "Could not fetch FRED series BAMLH0A0HYM2. Set env var FRED_API_KEY.",
-            "updatedAt": as_of
-        })
-
-    # 3) IG OAS (FRED)
-    ig = fred_latest("BAMLC0A0CM", fred_key)
-    if ig:
-        _, ig_val = ig
-        ig_bp = ig_val * 100.0
-        cards.append({
-            "id": "ig_oas",
-            "type": "gauge",
-            "title": "INVESTMENT GRADE SPREAD (OAS)",
-            "status": status_from_band(ig_bp, good_max=130, warn_max=200, higher_is_worse=True),
-            "value": round(ig_bp, 0),
-            "unit": " bp",
-            "min": 80,
-            "max": 300,
-            "minLabel": "80",
-            "midLabel": "180",
-            "maxLabel": "300",
-            "tooltip": "IG OAS from FRED (ICE BofA). Higher = tighter conditions / credit stress.",
-            "updatedAt": as_of
-        })
-    else:
-        cards.append({
-            "id": "ig_oas",
-            "type": "gauge",
-            "title": "INVESTMENT GRADE SPREAD (OAS)",
-            "status": "DELAYED",
-            "valueText": "FRED key?",
-            "pct": 50,
-            "minLabel": "80",
-            "midLabel": "180",
-            "maxLabel": "300",
-            "tooltip": "Could not fetch FRED series BAMLC0A0CM. Set env var FRED_API_KEY.",
-            "updatedAt": as_of
-        })
-
-    # 4) 10Y-2Y curve (FRED)
-    curve = fred_latest("T10Y2Y", fred_key)
-    if curve:
-        _, c_val = curve
-        c_bp = c_val * 100.0
-        status = status_from_band(c_bp, good_max=0, warn_max=-50, higher_is_worse=False)
-        cards.append({
-            "id": "curve_10y2y",
-            "type": "gauge",
-            "title": "YIELD CURVE (10Y–2Y)",
-            "status": status,
-            "value": round(c_bp, 0),
-            "unit": " bp",
-            "min": -200,
-            "max": 200,
-            "minLabel": "-200",
-            "midLabel": "0",
-            "maxLabel": "200",
-            "tooltip": "10Y–2Y spread from FRED. More negative (inversion) = growth risk signal.",
-            "updatedAt": as_of
-        })
-    else:
-        cards.append({
-            "id": "curve_10y2y",
-            "type": "gauge",
-            "title": "YIELD CURVE (10Y–2Y)",
-            "status": "DELAYED",
-            "valueText": "FRED key?",
-            "pct": 50,
-            "minLabel": "-200",
-            "midLabel": "0",
-            "maxLabel": "200",
-            "tooltip": "Could not fetch FRED series T10Y2Y. Set env var FRED_API_KEY.",
-            "updatedAt": as_of
-        })
+    # 1-4) Latest-value FRED gauges: VIX, HY OAS, IG OAS, 10Y-2Y curve
+    for spec in FRED_LATEST_CARDS:
+        cards.append(fred_latest_card(spec, cache, as_of))
 
     # 5) SPY 1M drawdown (Stooq, 21 trading days)
-    try:
-        spy = stooq_daily_closes("spy.us")
-        dd1m = drawdown_pct(spy, lookback_days=21)
-        if dd1m is None:
-            raise RuntimeError("not enough SPY data")
-        dd1m = float(dd1m)
-        status = "GOOD"
-        if dd1m <= -6:
-            status = "WARN"
-        if dd1m <= -10:
-            status = "DELAYED"
-        cards.append({
-            "id": "spy_dd_1m",
-            "type": "gauge",
-            "title": "EQUITY DRAWDOWN (SPY, 1M)",
-            "status": status,
-            "value": round(dd1m, 1),
-            "unit": "%",
-            "min": -20,
-            "max": 0,
-            "minLabel": "-20%",
-            "midLabel": "-10%",
-            "maxLabel": "0%",
-            "tooltip": "SPY drawdown from 1M peak (21 trading days). More negative = risk-off.",
-            "updatedAt": as_of
-        })
-    except Exception as e:
-        cards.append({
-            "id": "spy_dd_1m",
-            "type": "gauge",
-            "title": "EQUITY DRAWDOWN (SPY, 1M)",
-            "status": "DELAYED",
-            "valueText": "—",
-            "pct": 50,
-            "minLabel": "-20%",
-            "midLabel": "-10%",
-            "maxLabel": "0%",
-            "tooltip": f"SPY fetch failed: {e}",
-            "updatedAt": as_of
-        })
+    cards.append(drawdown_card(SPY_DRAWDOWN_CARD, cache, as_of))
 
     # ---5.5 MARKET BREADTH (RSP vs SPY, 20-day return) ---
     try:
-        spy = stooq_daily_closes("spy.us")
-        rsp = stooq_daily_closes("rsp.us")
+        spy = fetched(cache, "spy.us")
+        rsp = fetched(cache, "rsp.us")
 
-        def pct_return(bars, lookback):
-            if len(bars) < lookback + 1:
+        def pct_return(closes, lookback):
+            if len(closes) < lookback + 1:
                 return None
-            start = bars[-lookback - 1].close
-            end = bars[-1].close
+            start = closes[-lookback - 1]
+            end = closes[-1]
             return (end / start - 1.0) * 100.0
 
-        spy_ret = pct_return(spy, 20)
-        rsp_ret = pct_return(rsp, 20)
+        spy_ret = pct_return(spy.closes, 20)
+        rsp_ret = pct_return(rsp.closes, 20)
 
         if spy_ret is None or rsp_ret is None:
             raise RuntimeError("not enough SPY/RSP data")
@@ -799,83 +1189,25 @@ def make_cards() -> Dict:
         else:
             breadth_status = "WARN"
 
-        cards.append({
-            "id": "breadth",
-            "type": "gauge",
-            "title": "MARKET BREADTH",
-            "status": breadth_status,
-            "value": round(breadth_val, 1),
-            "unit": "%",
-            "min": -10,
-            "max": 10,
-            "minLabel": "Narrow",
-            "midLabel": "Neutral",
-            "maxLabel": "Broad",
-            "tooltip": "Equal-weight S&P (RSP) minus S&P 500 (SPY) 20-day return. Negative = narrow rally.",
-            "updatedAt": as_of
-        })
+        cards.append(gauge_card(
+            "breadth", "MARKET BREADTH", breadth_status, round(breadth_val, 1), "%", -10, 10,
+            ("Narrow", "Neutral", "Broad"),
+            "Equal-weight S&P (RSP) minus S&P 500 (SPY) 20-day return. Negative = narrow rally.", as_of))
 
     except Exception as e:
-        cards.append({
-            "id": "breadth",
-            "type": "gauge",
-            "title": "MARKET BREADTH",
-            "status": "DELAYED",
-            "valueText": "—",
-            "pct": 50,
-            "tooltip": f"Breadth calc failed: {e}",
-            "updatedAt": as_of
-        })
+        cards.append(delayed_card("breadth", "MARKET BREADTH", "—", None, f"Breadth calc failed: {e}", as_of))
 
     # 6) KRE 3M drawdown (Stooq, 63 trading days)
-    try:
-        kre = stooq_daily_closes("kre.us")
-        dd3m = drawdown_pct(kre, lookback_days=63)
-        if dd3m is None:
-            raise RuntimeError("not enough KRE data")
-        dd3m = float(dd3m)
-        status = "GOOD"
-        if dd3m <= -8:
-            status = "WARN"
-        if dd3m <= -15:
-            status = "DELAYED"
-        cards.append({
-            "id": "kre_dd_3m",
-            "type": "gauge",
-            "title": "REGIONAL BANKS DRAWDOWN (KRE, 3M)",
-            "status": status,
-            "value": round(dd3m, 1),
-            "unit": "%",
-            "min": -30,
-            "max": 0,
-            "minLabel": "-30%",
-            "midLabel": "-15%",
-            "maxLabel": "0%",
-            "tooltip": "KRE drawdown from 3M peak (63 trading days). More negative = bank stress proxy.",
-            "updatedAt": as_of
-        })
-    except Exception as e:
-        cards.append({
-            "id": "kre_dd_3m",
-            "type": "gauge",
-            "title": "REGIONAL BANKS DRAWDOWN (KRE, 3M)",
-            "status": "DELAYED",
-            "valueText": "—",
-            "pct": 50,
-            "minLabel": "-30%",
-            "midLabel": "-15%",
-            "maxLabel": "0%",
-            "tooltip": f"KRE fetch failed: {e}",
-            "updatedAt": as_of
-        })
+    cards.append(drawdown_card(KRE_DRAWDOWN_CARD, cache, as_of))
 
     # 7) RECESSION RISK (Composite 0–100)
+    title, labels = "RECESSION RISK", ("Low", "Elevated", "High")
     try:
-        rec_score, rec_tooltip, _, rec_details = build_recession_dial(fred_key)
+        rec_score, rec_tooltip, _, rec_details = build_recession_dial(history)
         if rec_score is None:
             raise RuntimeError("missing components")
         prev = prev_card_value(prev_payload, "recession_risk")
-        rec_sm = smooth_with_previous(rec_score, prev, alpha=0.20)
+        rec_sm = smooth_with_previous(rec_score, prev, alpha=SMOOTH_ALPHA)
         try:
             c = rec_details.get('curve', {})
             s = rec_details.get('sahm', {})
@@ -890,49 +1222,26 @@ def make_cards() -> Dict:
         except Exception:
             pass
 
-        cards.append({
-            "id": "recession_risk",
-            "type": "gauge",
-            "title": "RECESSION RISK",
-            "status": "GOOD" if rec_sm < 35 else ("WARN" if rec_sm < 60 else "DELAYED"),
-            "value": round(rec_sm, 0),
-            "unit": "",
-            "min": 0,
-            "max": 100,
-            "minLabel": "Low",
-            "midLabel": "Elevated",
-            "maxLabel": "High",
-            "tooltip": rec_tooltip,
-            "details": {
+        cards.append(gauge_card(
+            "recession_risk", title, "GOOD" if rec_sm < 35 else ("WARN" if rec_sm < 60 else "DELAYED"),
+            round(rec_sm, 0), "", 0, 100, labels, rec_tooltip, as_of,
+            details={
                 "raw": float(rec_score),
                 "smoothed": float(rec_sm),
                 "prev": float(prev) if prev is not None else None,
                 "components": rec_details,
-            },
-            "updatedAt": as_of
-        })
+            }))
     except Exception as e:
-        cards.append({
-            "id": "recession_risk",
-            "type": "gauge",
-            "title": "RECESSION RISK",
-            "status": "DELAYED",
-            "valueText": "—",
-            "pct": 50,
-            "minLabel": "Low",
-            "midLabel": "Elevated",
-            "maxLabel": "High",
-            "tooltip": f"Recession dial build failed: {e}",
-            "updatedAt": as_of
-        })
+        cards.append(delayed_card("recession_risk", title, "—", labels, f"Recession dial build failed: {e}", as_of))
 
     # 8) CREDIT STRESS (Composite 0–100)
+    title, labels = "CREDIT STRESS", ("Easy", "Tightening", "Crisis")
     try:
-        cs_score, cs_tooltip, _, cs_details = build_credit_stress_dial(fred_key)
+        cs_score, cs_tooltip, _, cs_details = build_credit_stress_dial(history)
         if cs_score is None:
             raise RuntimeError("missing components")
         prev = prev_card_value(prev_payload, "credit_stress")
-        cs_sm = smooth_with_previous(cs_score, prev, alpha=0.20)
+        cs_sm = smooth_with_previous(cs_score, prev, alpha=SMOOTH_ALPHA)
         try:
             m = cs_details.get('momentum', {})
             print(
@@ -945,41 +1254,17 @@ def make_cards() -> Dict:
         except Exception:
             pass
 
-        cards.append({
-            "id": "credit_stress",
-            "type": "gauge",
-            "title": "CREDIT STRESS",
-            "status": "GOOD" if cs_sm < 40 else ("WARN" if cs_sm < 65 else "DELAYED"),
-            "value": round(cs_sm, 0),
-            "unit": "",
-            "min": 0,
-            "max": 100,
-            "minLabel": "Easy",
-            "midLabel": "Tightening",
-            "maxLabel": "Crisis",
-            "tooltip": cs_tooltip,
-            "details": {
+        cards.append(gauge_card(
+            "credit_stress", title, "GOOD" if cs_sm < 40 else ("WARN" if cs_sm < 65 else "DELAYED"),
+            round(cs_sm, 0), "", 0, 100, labels, cs_tooltip, as_of,
+            details={
                 "raw": float(cs_score),
                 "smoothed": float(cs_sm),
                 "prev": float(prev) if prev is not None else None,
                 "components": cs_details,
-            },
-            "updatedAt": as_of
-        })
+            }))
     except Exception as e:
-        cards.append({
-            "id": "credit_stress",
-            "type": "gauge",
-            "title": "CREDIT STRESS",
-            "status": "DELAYED",
-            "valueText": "—",
-            "pct": 50,
-            "minLabel": "Easy",
-            "midLabel": "Tightening",
-            "maxLabel": "Crisis",
-            "tooltip": f"Credit stress dial build failed: {e}",
-            "updatedAt": as_of
-        })
+        cards.append(delayed_card("credit_stress", title, "—", labels, f"Credit stress dial build failed: {e}", as_of))
 
     return {
         "asOf": as_of,
@@ -989,6 +1274,8 @@ def make_cards() -> Dict:
 
 def main() -> int:
     payload = make_cards()
+    removed = prune_http_cache()
+    print(f"HTTP cache: {_http_cache_stats['hits']} responses revalidated (304), {removed} stale files removed.")
     # Update weekly history for sparklines/charts (one row per week)
     try:
         d = parse_iso_date(payload.get('asOf', utc_now_iso()))
@@ -1035,9 +1322,13 @@ def main() -> int:
     except Exception as e:
         print(f"Daily history update skipped: {e}")
 
+    # Skip the rewrite when only timestamps would change (weekends, reruns): no git churn.
+    prev_payload = load_previous_payload()
+    if prev_payload and payload_fingerprint(prev_payload) == payload_fingerprint(payload):
+        print(f"{OUTFILE} unchanged (asOf={prev_payload.get('asOf')}); not rewritten.")
+        return 0
 
-    OUTFILE.parent.mkdir(parents=True, exist_ok=True)
-    OUTFILE.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    write_atomic(OUTFILE, json_dumps_pretty(payload))
     print(f"Wrote {OUTFILE} with asOf={payload['asOf']} and {len(payload['cards'])} cards.")
     return 0
 